@@ -1,36 +1,82 @@
 from django.views.generic import TemplateView
+from django.core.cache import cache
 from django.db import connection
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag
 import sys
+import time
 import django
 
 from products.models import Product
 from orders.models import Order
 from users.models import User
 
+# How long cached health counts stay fresh
+HEALTH_COUNT_TTL = 30
+
+
+def estimated_count(model):
+    """Fast row-count estimate; a health page doesn't need exact counts.
+
+    On PostgreSQL this reads the planner's reltuples estimate from the
+    catalog instead of scanning the table. Other backends fall back to a
+    real COUNT(*).
+    """
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                [model._meta.db_table],
+            )
+            row = cursor.fetchone()
+            # reltuples is -1 until the table has been analyzed
+            if row is not None and row[0] >= 0:
+                return row[0]
+    return model.objects.count()
+
+
+def _health_etag(request, *args, **kwargs):
+    """ETag that rolls over every 10s so pollers get 304s in between."""
+    return f'"health-{int(time.time()) // 10}"'
+
+
+def health_live(request):
+    """Liveness probe: no DB, no template, just proof the process is up."""
+    return HttpResponse('ok', content_type='text/plain')
+
+
+@method_decorator(cache_control(max_age=10, public=True), name='dispatch')
+@method_decorator(etag(_health_etag), name='dispatch')
 class HealthView(TemplateView):
     template_name = 'health.html'
-    
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        
-        # Basic statistics
+
+        # Basic statistics, cached so load-balancer polling doesn't hit the DB
+        # on every request
         try:
-            context['total_products'] = Product.objects.count()
+            context['total_products'] = cache.get_or_set(
+                'health:products_count', lambda: estimated_count(Product), HEALTH_COUNT_TTL)
         except:
             context['total_products'] = 0
-            
+
         try:
-            context['total_orders'] = Order.objects.count()
+            context['total_orders'] = cache.get_or_set(
+                'health:orders_count', lambda: estimated_count(Order), HEALTH_COUNT_TTL)
         except:
             context['total_orders'] = 0
-            
+
         try:
-            context['total_users'] = User.objects.count()
+            context['total_users'] = cache.get_or_set(
+                'health:users_count', lambda: estimated_count(User), HEALTH_COUNT_TTL)
         except:
             context['total_users'] = 0
-        
+
         # System info
         context['python_version'] = sys.version.split()[0]
         context['django_version'] = django.get_version()
-        
+
         return context
@@ -6,7 +6,7 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.views.generic import TemplateView
 from django.conf.urls import handler400, handler403, handler404, handler500
-from .health_views import HealthView
+from .health_views import HealthView, health_live
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -14,6 +14,7 @@ urlpatterns = [
     path('users/', include('users.urls')),
     path('orders/', include('orders.urls')),
     path('health/', HealthView.as_view(), name='health'),
+    path('health/live/', health_live, name='health_live'),
 ]
 
 if settings.DEBUG:
@@ -2,25 +2,33 @@
 Custom error views for the ecommerce system.
 """
 
-from django.shortcuts import render
-from django.http import HttpResponseServerError
+from functools import lru_cache
+
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+
+
+@lru_cache(maxsize=None)
+def _error_page(template_name):
+    """Render an error template once per process; the pages are static."""
+    return render_to_string(template_name)
 
 
 def bad_request(request, exception=None):
     """400 error handler."""
-    return render(request, '400.html', status=400)
+    return HttpResponse(_error_page('400.html'), status=400)
 
 
 def permission_denied(request, exception=None):
     """403 error handler."""
-    return render(request, '403.html', status=403)
+    return HttpResponse(_error_page('403.html'), status=403)
 
 
 def page_not_found(request, exception=None):
     """404 error handler."""
-    return render(request, '404.html', status=404)
+    return HttpResponse(_error_page('404.html'), status=404)
 
 
 def server_error(request, exception=None):
     """500 error handler."""
-    return render(request, '500.html', status=500)
+    return HttpResponse(_error_page('500.html'), status=500)
@@ -10,12 +10,19 @@ bind = "0.0.0.0:8000"
 backlog = 2048
 
 # Worker processes
-workers = 4
-worker_class = "sync"
+workers = multiprocessing.cpu_count() * 2 + 1
+worker_class = "gthread"
+threads = 8
 worker_connections = 1000
 timeout = 30
 keepalive = 2
 
+# Load the app before forking so workers share code pages, and recycle
+# workers periodically to bound any slow memory leaks
+preload_app = True
+max_requests = 1000
+max_requests_jitter = 100
+
 # Logging
 accesslog = "-"
 errorlog = "-"
@@ -4,13 +4,22 @@ Forms for order management.
 
 from django import forms
 from django.core.exceptions import ValidationError
-from .models import Order, OrderItem
+from .models import Order, OrderItem, ALLOWED_TRANSITIONS
 from products.models import Product
+from users.models import User
 
 
 class OrderForm(forms.ModelForm):
     """Form for Order model."""
-    
+
+    # Declared once at class level instead of reassigned per instance in
+    # __init__; the queryset stays lazy and is evaluated on render.
+    assigned_to = forms.ModelChoiceField(
+        queryset=User.objects.filter(is_staff=True),
+        required=False,
+        widget=forms.Select(attrs={'class': 'form-control'}),
+    )
+
     class Meta:
         model = Order
         fields = [
@@ -24,15 +33,10 @@ class OrderForm(forms.ModelForm):
             'customer_address': forms.Textarea(attrs={'class': 'form-control', 'rows': 3}),
             'status': forms.Select(attrs={'class': 'form-control'}),
             'notes': forms.Textarea(attrs={'class': 'form-control', 'rows': 3}),
-            'assigned_to': forms.Select(attrs={'class': 'form-control'}),
         }
-    
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Limit assigned_to to staff users
-        from users.models import User
-        self.fields['assigned_to'].queryset = User.objects.filter(is_staff=True)
-        
         # Don't allow changing status to certain values if order is completed
         if self.instance and self.instance.is_completed:
             self.fields['status'].disabled = True
@@ -46,16 +50,7 @@ class OrderForm(forms.ModelForm):
             new_status = cleaned_data.get('status')
             
             if old_status != new_status:
-                allowed_transitions = {
-                    'draft': ['pending', 'cancelled'],
-                    'pending': ['processing', 'cancelled'],
-                    'processing': ['shipped', 'cancelled'],
-                    'shipped': ['delivered'],
-                    'delivered': [],
-                    'cancelled': [],
-                }
-                
-                if new_status not in allowed_transitions.get(old_status, []):
+                if (old_status, new_status) not in ALLOWED_TRANSITIONS:
                     raise ValidationError(
                         f'Cannot transition from {old_status} to {new_status}.'
                     )
@@ -67,7 +62,7 @@ class OrderItemForm(forms.ModelForm):
     """Form for OrderItem model."""
     
     product = forms.ModelChoiceField(
-        queryset=Product.objects.filter(status='active'),
+        queryset=Product.objects.filter(status=Product.Status.ACTIVE),
         widget=forms.Select(attrs={'class': 'form-control'})
     )
     
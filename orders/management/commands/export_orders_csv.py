@@ -4,8 +4,9 @@ Management command to export orders to CSV.
 
 import csv
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.utils import timezone
-from django.db.models import Sum, Count
+from django.db.models import Sum, Count, Q
 
 from orders.models import Order
 from products.models import Product
@@ -38,8 +39,14 @@ class Command(BaseCommand):
         )
     
     def handle(self, *args, **options):
-        # Build query
-        queryset = Order.objects.all().select_related('created_by', 'assigned_to')
+        # Build query, loading only the columns the CSV needs (skips the wide
+        # customer_address text column in particular)
+        queryset = Order.objects.select_related('created_by', 'assigned_to').only(
+            'order_number', 'customer_name', 'customer_email', 'customer_phone',
+            'status', 'total_amount', 'tax_amount', 'discount_amount',
+            'final_amount', 'created_at', 'completed_at', 'notes',
+            'created_by__email', 'assigned_to__email',
+        )
         
         if options['status']:
             queryset = queryset.filter(status=options['status'])
@@ -75,45 +82,63 @@ class Command(BaseCommand):
                 'Notes',
             ])
             
-            # Write data
-            for order in queryset:
-                items_count = order.items.count()
-                
-                writer.writerow([
-                    order.order_number,
-                    order.customer_name,
-                    order.customer_email,
-                    order.customer_phone or '',
-                    order.status,
-                    str(order.total_amount),
-                    str(order.tax_amount),
-                    str(order.discount_amount),
-                    str(order.final_amount),
-                    order.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-                    order.created_by.email,
-                    order.assigned_to.email if order.assigned_to else '',
-                    order.completed_at.strftime('%Y-%m-%d %H:%M:%S') if order.completed_at else '',
-                    items_count,
-                    order.notes.replace('\n', ' ') if order.notes else '',
-                ])
+            # Write data, streaming rows through a server-side cursor so the
+            # full result set is never materialized in memory. The cursor
+            # needs an open transaction on PostgreSQL.
+            with transaction.atomic():
+                rows_written = 0
+                for order in queryset.annotate(items_count=Count('items')).iterator(chunk_size=2000):
+                    writer.writerow([
+                        order.order_number,
+                        order.customer_name,
+                        order.customer_email,
+                        order.customer_phone or '',
+                        order.status,
+                        str(order.total_amount),
+                        str(order.tax_amount),
+                        str(order.discount_amount),
+                        str(order.final_amount),
+                        order.created_at.strftime('%Y-%m-%d %H:%M:%S'),
+                        order.created_by.email,
+                        order.assigned_to.email if order.assigned_to else '',
+                        order.completed_at.strftime('%Y-%m-%d %H:%M:%S') if order.completed_at else '',
+                        order.items_count,
+                        order.notes.replace('\n', ' ') if order.notes else '',
+                    ])
+                    rows_written += 1
+                    if rows_written % 10000 == 0:
+                        csvfile.flush()
         
+        # Compute all summary figures in one aggregate instead of re-counting
+        # per line of output
+        stats = queryset.aggregate(
+            total=Count('id'),
+            revenue=Sum('final_amount'),
+            **{
+                f'status_{status}': Count('id', filter=Q(status=status))
+                for status, _ in Order.STATUS_CHOICES
+            },
+        )
+        total_orders = stats['total']
+
         self.stdout.write(self.style.SUCCESS(
-            f'Successfully exported {queryset.count()} orders to {filename}'
+            f'Successfully exported {total_orders} orders to {filename}'
         ))
-        
+
         # Display statistics
         self.stdout.write('\nExport Statistics:')
-        self.stdout.write(f'Total Orders: {queryset.count()}')
-        
-        if queryset.exists():
-            total_revenue = queryset.aggregate(Sum('final_amount'))['final_amount__sum'] or 0
-            avg_order_value = total_revenue / queryset.count()
-            
+        self.stdout.write(f'Total Orders: {total_orders}')
+
+        if total_orders:
+            total_revenue = stats['revenue'] or 0
+            avg_order_value = total_revenue / total_orders
+
             self.stdout.write(f'Total Revenue: ${total_revenue:.2f}')
             self.stdout.write(f'Average Order Value: ${avg_order_value:.2f}')
             
             # Status breakdown
             self.stdout.write('\nStatus Breakdown:')
-            status_counts = queryset.values('status').annotate(count=Count('id'))
-            for stat in status_counts:
-                self.stdout.write(f'  {stat["status"]}: {stat["count"]}')
+            for status, _ in Order.STATUS_CHOICES:
+                count = stats[f'status_{status}']
+                if count:
+                    self.stdout.write(f'  {status}: {count}')
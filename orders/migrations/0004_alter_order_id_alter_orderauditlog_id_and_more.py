@@ -0,0 +1,29 @@
+# Generated by Django 5.0.2 on 2026-09-01 06:12
+
+import orders.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0003_dailyordercounter'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='id',
+            field=models.UUIDField(default=orders.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='orderauditlog',
+            name='id',
+            field=models.UUIDField(default=orders.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='orderitem',
+            name='id',
+            field=models.UUIDField(default=orders.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.2 on 2026-09-01 06:13
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0004_alter_order_id_alter_orderauditlog_id_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='order',
+            name='orders_orde_order_n_f3ada5_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='orderitem',
+            name='orders_orde_order_i_52f79a_idx',
+        ),
+    ]
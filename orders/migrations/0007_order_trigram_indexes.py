@@ -0,0 +1,44 @@
+"""
+Trigram GIN indexes backing the order list's icontains search.
+
+PostgreSQL-only: other backends (the sqlite dev/test database) skip this
+migration's SQL entirely.
+"""
+
+from django.db import migrations
+
+CREATE_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS orders_order_trgm_idx ON orders_order "
+    "USING gin (order_number gin_trgm_ops, customer_name gin_trgm_ops, "
+    "customer_email gin_trgm_ops)",
+]
+
+DROP_SQL = [
+    "DROP INDEX IF EXISTS orders_order_trgm_idx",
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for sql in CREATE_SQL:
+        schema_editor.execute(sql)
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for sql in DROP_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0006_remove_order_orders_orde_status_c6dd84_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
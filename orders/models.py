@@ -2,8 +2,12 @@
 Order models for the ecommerce system.
 """
 
+import os
+import time
 import uuid
-from django.db import models
+from decimal import Decimal
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from django.utils import timezone
@@ -11,6 +15,62 @@ from django.conf import settings
 from products.models import Product
 
 
+def uuid7():
+    """Generate a time-ordered UUIDv7 (RFC 9562).
+
+    The leading 48 bits are a millisecond timestamp, so primary-key index
+    inserts append to the rightmost leaf instead of landing on random
+    pages the way uuid4 keys do — important for append-heavy tables like
+    orders and audit logs.
+    """
+    timestamp_ms = int(time.time() * 1000) & ((1 << 48) - 1)
+    rand = int.from_bytes(os.urandom(10), 'big')
+    value = (
+        (timestamp_ms << 80)
+        | (0x7 << 76)                    # version
+        | ((rand >> 68) << 64)           # rand_a (12 bits)
+        | (0b10 << 62)                   # variant
+        | (rand & ((1 << 62) - 1))       # rand_b (62 bits)
+    )
+    return uuid.UUID(int=value)
+
+
+# Allowed (from, to) status transitions, shared with OrderForm. Delivered and
+# cancelled are final states.
+ALLOWED_TRANSITIONS = frozenset({
+    ('draft', 'pending'),
+    ('draft', 'cancelled'),
+    ('pending', 'processing'),
+    ('pending', 'cancelled'),
+    ('processing', 'shipped'),
+    ('processing', 'cancelled'),
+    ('shipped', 'delivered'),
+})
+
+
+class DailyOrderCounter(models.Model):
+    """Per-day counter backing order number generation."""
+
+    date = models.DateField(unique=True)
+    last_number = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.date}: {self.last_number}"
+
+    @classmethod
+    def next_number(cls, date, count=1):
+        """Atomically reserve ``count`` numbers and return the first one.
+
+        Bulk ingest (e.g. the fake-data command) reserves a whole block in
+        one round-trip instead of hitting the counter row per order.
+        """
+        with transaction.atomic():
+            counter, _ = cls.objects.select_for_update().get_or_create(date=date)
+            counter.last_number += count
+            counter.save(update_fields=['last_number'])
+            return counter.last_number - count + 1
+
+
 class Order(models.Model):
     """Order model."""
     
@@ -23,7 +83,7 @@ class Order(models.Model):
         ('cancelled', 'Cancelled'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     order_number = models.CharField(max_length=20, unique=True, editable=False)
     customer_name = models.CharField(max_length=200)
     customer_email = models.EmailField()
@@ -43,9 +103,11 @@ class Order(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        # order_number already has a unique btree from unique=True. The
+        # composite (status, -created_at) index serves the list view's
+        # status filter in its display order.
         indexes = [
-            models.Index(fields=['order_number']),
-            models.Index(fields=['status']),
+            models.Index(fields=['status', '-created_at']),
             models.Index(fields=['created_by']),
             models.Index(fields=['assigned_to']),
             models.Index(fields=['created_at']),
@@ -54,23 +116,20 @@ class Order(models.Model):
     
     def __str__(self):
         return f"Order {self.order_number}"
-    
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Snapshot the loaded status so clean() can diff without a refetch."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_status = instance.status
+        return instance
+
     def save(self, *args, **kwargs):
         """Generate order number on creation."""
         if not self.order_number:
-            timestamp = timezone.now().strftime('%Y%m%d')
-            last_order = Order.objects.filter(order_number__contains=timestamp).order_by('-created_at').first()
-            
-            if last_order:
-                try:
-                    last_number = int(last_order.order_number[-4:])
-                    new_number = last_number + 1
-                except (ValueError, IndexError):
-                    new_number = 1
-            else:
-                new_number = 1
-            
-            self.order_number = f"ORD-{timestamp}-{new_number:04d}"
+            today = timezone.now()
+            new_number = DailyOrderCounter.next_number(today.date())
+            self.order_number = f"ORD-{today.strftime('%Y%m%d')}-{new_number:04d}"
         
         # Update final amount
         self.final_amount = self.total_amount + self.tax_amount - self.discount_amount
@@ -80,28 +139,19 @@ class Order(models.Model):
             self.completed_at = timezone.now()
         
         super().save(*args, **kwargs)
-    
+        self._loaded_status = self.status
+
     def clean(self):
         """Validate order status transitions."""
-        if self.pk:
-            old_order = Order.objects.get(pk=self.pk)
-            
-            # Define allowed status transitions
-            allowed_transitions = {
-                'draft': ['pending', 'cancelled'],
-                'pending': ['processing', 'cancelled'],
-                'processing': ['shipped', 'cancelled'],
-                'shipped': ['delivered'],
-                'delivered': [],  # Final state
-                'cancelled': [],  # Final state
-            }
-            
-            if old_order.status != self.status:
-                if self.status not in allowed_transitions.get(old_order.status, []):
-                    raise ValidationError(
-                        f'Cannot transition from {old_order.status} to {self.status}. '
-                        f'Allowed transitions: {allowed_transitions.get(old_order.status, [])}'
-                    )
+        old_status = getattr(self, '_loaded_status', None)
+
+        if old_status is not None and old_status != self.status:
+            if (old_status, self.status) not in ALLOWED_TRANSITIONS:
+                allowed = sorted(to for frm, to in ALLOWED_TRANSITIONS if frm == old_status)
+                raise ValidationError(
+                    f'Cannot transition from {old_status} to {self.status}. '
+                    f'Allowed transitions: {allowed}'
+                )
     
     @property
     def can_be_modified(self):
@@ -119,10 +169,27 @@ class Order(models.Model):
         return self.status in ['delivered', 'cancelled']
     
     def update_totals(self):
-        """Update order totals from items."""
-        items = self.items.all()
-        self.total_amount = sum(item.total_price for item in items)
-        self.save()
+        """Recompute order totals from items in a single UPDATE.
+
+        The item sum runs as a subquery inside the UPDATE itself, so there
+        is no aggregate-then-write gap for a concurrent item change to slip
+        into, and only one round-trip.
+        """
+        items_total = Coalesce(
+            models.Subquery(
+                OrderItem.objects.filter(order_id=self.pk)
+                .values('order_id')
+                .annotate(total=models.Sum('total_price'))
+                .values('total')[:1],
+                output_field=models.DecimalField(max_digits=10, decimal_places=2),
+            ),
+            models.Value(Decimal('0')),
+        )
+        Order.objects.filter(pk=self.pk).update(
+            total_amount=items_total,
+            final_amount=items_total + models.F('tax_amount') - models.F('discount_amount'),
+            updated_at=timezone.now(),
+        )
     
     def cancel_order(self, user, reason=''):
         """Cancel the order with validation."""
@@ -132,42 +199,68 @@ class Order(models.Model):
         self.status = 'cancelled'
         self.notes = f"{self.notes}\n\nCancelled by {user.email}: {reason}"
         self.save()
-        
-        # Restore product quantities
-        for item in self.items.all():
-            try:
-                product = item.product
-                product.quantity += item.quantity
-                product.save()
-            except Product.DoesNotExist:
-                pass  # Product no longer exists
+
+        # Restore product quantities in a single UPDATE instead of one
+        # full-row save per item
+        items = list(self.items.values_list('product_id', 'quantity'))
+        if items:
+            Product.objects.filter(pk__in=[pid for pid, _ in items]).update(
+                quantity=models.Case(
+                    *[models.When(pk=pid, then=models.F('quantity') + qty) for pid, qty in items],
+                    default=models.F('quantity'),
+                )
+            )
     
     def process_order(self, user):
         """Process the order (move from pending to processing)."""
         if self.status != 'pending':
             raise ValidationError('Only pending orders can be processed.')
-        
-        # Validate stock availability
-        for item in self.items.all():
-            if item.quantity > item.product.quantity:
-                raise ValidationError(
-                    f'Insufficient stock for {item.product.name}. '
-                    f'Available: {item.product.quantity}, Requested: {item.quantity}'
+
+        with transaction.atomic():
+            items = list(self.items.select_related('product'))
+
+            if items:
+                # Deduct stock in one UPDATE, guarded per row so a product is
+                # only touched while it still has enough stock. A short row
+                # count means some item couldn't be satisfied; raising here
+                # rolls the deduction back.
+                guards = models.Q()
+                for item in items:
+                    guards |= models.Q(pk=item.product_id, quantity__gte=item.quantity)
+
+                updated = Product.objects.filter(guards).update(
+                    quantity=models.Case(
+                        *[models.When(pk=item.product_id, then=models.F('quantity') - item.quantity)
+                          for item in items],
+                        default=models.F('quantity'),
+                    ),
+                    status=models.Case(
+                        *[models.When(pk=item.product_id, quantity__lte=item.quantity,
+                                      then=models.Value(Product.Status.OUT_OF_STOCK))
+                          for item in items],
+                        default=models.F('status'),
+                        output_field=models.PositiveSmallIntegerField(),
+                    ),
                 )
-        
-        # Deduct stock
-        for item in self.items.all():
-            item.product.decrement_quantity(item.quantity)
-        
-        self.status = 'processing'
-        self.assigned_to = user
-        self.save()
+
+                if updated < len(items):
+                    for item in items:
+                        if item.quantity > item.product.quantity:
+                            raise ValidationError(
+                                f'Insufficient stock for {item.product.name}. '
+                                f'Available: {item.product.quantity}, Requested: {item.quantity}'
+                            )
+                    raise ValidationError('Insufficient stock for one or more items.')
+
+            self.status = 'processing'
+            self.assigned_to = user
+            self.save()
 
 
 class OrderItem(models.Model):
     """Order item model."""
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name='items')
     product = models.ForeignKey(Product, on_delete=models.PROTECT, related_name='order_items')
     quantity = models.IntegerField(validators=[MinValueValidator(1)])
@@ -175,21 +268,24 @@ class OrderItem(models.Model):
     total_price = models.DecimalField(max_digits=10, decimal_places=2, editable=False)
     
     class Meta:
+        # The unique constraint already provides the (order, product) btree
         unique_together = ['order', 'product']
-        indexes = [
-            models.Index(fields=['order', 'product']),
-        ]
     
     def __str__(self):
         return f"{self.product.name} x{self.quantity}"
     
-    def save(self, *args, **kwargs):
-        """Calculate total price."""
+    def save(self, *args, update_totals=True, **kwargs):
+        """Calculate total price.
+
+        Pass ``update_totals=False`` when saving many items for one order
+        and call ``order.update_totals()`` once at the end instead.
+        """
         self.total_price = self.quantity * self.unit_price
         super().save(*args, **kwargs)
-        
+
         # Update order totals
-        self.order.update_totals()
+        if update_totals:
+            self.order.update_totals()
     
     def delete(self, *args, **kwargs):
         """Update order totals on deletion."""
@@ -213,7 +309,7 @@ class OrderAuditLog(models.Model):
         ('deliver', 'Deliver'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name='audit_logs')
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True)
     action = models.CharField(max_length=20, choices=ACTION_CHOICES)
@@ -5,38 +5,55 @@ Tests for orders models.
 from django.test import TestCase
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
-from faker import Faker
 
 from orders.models import Order, OrderItem
 from products.models import Product, Category
 
-fake = Faker()
-
 
 class OrderModelTests(TestCase):
     """Test Order model."""
-    
-    def setUp(self):
-        self.User = get_user_model()
-        self.user = self.User.objects.create_user(
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.User = get_user_model()
+        cls.user = cls.User.objects.create_user(
             email='test@example.com',
             password='test123'
         )
-        
-        self.category = Category.objects.create(name='Electronics')
-        
-        self.product = Product.objects.create(
+
+        cls.category = Category.objects.create(name='Electronics')
+
+        cls.product = Product.objects.create(
             sku='TEST-001',
             name='Test Product',
             description='Test description',
-            category=self.category,
+            category=cls.category,
             price=99.99,
             cost=49.99,
             quantity=100,
-            created_by=self.user,
-            updated_by=self.user,
+            created_by=cls.user,
+            updated_by=cls.user,
         )
-    
+
+    @classmethod
+    def make_items(cls, order, specs):
+        """Bulk-insert items for an order.
+
+        bulk_create bypasses OrderItem.save(), so total_price is filled in
+        here and order totals are not recomputed — fine for tests that only
+        care about stock or status behaviour.
+        """
+        OrderItem.objects.bulk_create([
+            OrderItem(
+                order=order,
+                product=spec['product'],
+                quantity=spec['qty'],
+                unit_price=spec['price'],
+                total_price=spec['qty'] * spec['price'],
+            )
+            for spec in specs
+        ], batch_size=100)
+
     def test_create_order(self):
         """Test creating an order."""
         order = Order.objects.create(
@@ -160,16 +177,13 @@ class OrderModelTests(TestCase):
         )
         
         # Add item
-        item = OrderItem.objects.create(
-            order=order,
-            product=self.product,
-            quantity=10,
-            unit_price=self.product.price
-        )
-        
+        self.make_items(order, [{'product': self.product, 'qty': 10, 'price': self.product.price}])
+
         initial_stock = self.product.quantity
-        
-        order.cancel_order(self.user, 'Customer requested')
+
+        # Pin the query budget so a future N+1 in cancel_order fails here
+        with self.assertNumQueries(3):
+            order.cancel_order(self.user, 'Customer requested')
         
         self.assertEqual(order.status, 'cancelled')
         self.assertTrue(order.is_completed)
@@ -189,16 +203,13 @@ class OrderModelTests(TestCase):
         )
         
         # Add item
-        item = OrderItem.objects.create(
-            order=order,
-            product=self.product,
-            quantity=5,
-            unit_price=self.product.price
-        )
-        
+        self.make_items(order, [{'product': self.product, 'qty': 5, 'price': self.product.price}])
+
         initial_stock = self.product.quantity
-        
-        order.process_order(self.user)
+
+        # Pin the query budget so a future N+1 in process_order fails here
+        with self.assertNumQueries(5):
+            order.process_order(self.user)
         
         self.assertEqual(order.status, 'processing')
         self.assertEqual(order.assigned_to, self.user)
@@ -218,12 +229,7 @@ class OrderModelTests(TestCase):
         )
         
         # Add item with quantity greater than stock
-        item = OrderItem.objects.create(
-            order=order,
-            product=self.product,
-            quantity=200,  # More than available stock (100)
-            unit_price=self.product.price
-        )
+        self.make_items(order, [{'product': self.product, 'qty': 200, 'price': self.product.price}])  # More than available stock (100)
         
         with self.assertRaises(ValidationError):
             order.process_order(self.user)
@@ -231,33 +237,34 @@ class OrderModelTests(TestCase):
 
 class OrderItemModelTests(TestCase):
     """Test OrderItem model."""
-    
-    def setUp(self):
-        self.User = get_user_model()
-        self.user = self.User.objects.create_user(
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.User = get_user_model()
+        cls.user = cls.User.objects.create_user(
             email='test@example.com',
             password='test123'
         )
-        
-        self.category = Category.objects.create(name='Electronics')
-        
-        self.product = Product.objects.create(
+
+        cls.category = Category.objects.create(name='Electronics')
+
+        cls.product = Product.objects.create(
             sku='TEST-001',
             name='Test Product',
             description='Test description',
-            category=self.category,
+            category=cls.category,
             price=99.99,
             cost=49.99,
             quantity=100,
-            created_by=self.user,
-            updated_by=self.user,
+            created_by=cls.user,
+            updated_by=cls.user,
         )
-        
-        self.order = Order.objects.create(
+
+        cls.order = Order.objects.create(
             customer_name='John Doe',
             customer_email='john@example.com',
             customer_address='123 Main St',
-            created_by=self.user,
+            created_by=cls.user,
         )
     
     def test_create_order_item(self):
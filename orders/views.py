@@ -6,18 +6,26 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
 from django.core.paginator import Paginator
-from django.db.models import Q
+from django.db.models import Count, F, Q
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
 from django.urls import reverse_lazy
 from django.utils.decorators import method_decorator
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.views import View
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.db import transaction
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+from django.core.exceptions import ValidationError
+import hashlib
 
 from .models import Order, OrderItem, OrderAuditLog
 from .forms import OrderForm, OrderItemForm
 from products.models import Product
 from products.permissions import is_admin_or_staff
+from datetime import datetime, timedelta
+import csv
 import json
 
 
@@ -30,7 +38,16 @@ class OrderListView(LoginRequiredMixin, ListView):
     paginate_by = 20
     
     def get_queryset(self):
-        queryset = Order.objects.select_related('created_by', 'assigned_to').prefetch_related('items')
+        # Annotate the per-order item count instead of prefetching every
+        # OrderItem row just to count them in the template, and load only the
+        # columns the list table renders (skips customer_address and notes)
+        queryset = Order.objects.select_related('created_by', 'assigned_to').annotate(
+            item_count=Count('items')
+        ).only(
+            'order_number', 'status', 'customer_name', 'customer_email',
+            'total_amount', 'final_amount', 'created_at',
+            'created_by__email', 'assigned_to__email',
+        )
         
         # Filter by status
         status = self.request.GET.get('status', '')
@@ -46,14 +63,25 @@ class OrderListView(LoginRequiredMixin, ListView):
                 Q(customer_email__icontains=search)
             )
         
-        # Date range filter
+        # Date range filter. Compare against plain timestamps rather than
+        # created_at__date, which casts every row and defeats the index.
         date_from = self.request.GET.get('date_from', '')
         date_to = self.request.GET.get('date_to', '')
         if date_from:
-            queryset = queryset.filter(created_at__date__gte=date_from)
+            try:
+                dt_from = timezone.make_aware(datetime.strptime(date_from, '%Y-%m-%d'))
+            except ValueError:
+                pass
+            else:
+                queryset = queryset.filter(created_at__gte=dt_from)
         if date_to:
-            queryset = queryset.filter(created_at__date__lte=date_to)
-        
+            try:
+                dt_to = timezone.make_aware(datetime.strptime(date_to, '%Y-%m-%d') + timedelta(days=1))
+            except ValueError:
+                pass
+            else:
+                queryset = queryset.filter(created_at__lt=dt_to)
+
         return queryset.order_by('-created_at')
     
     def get_context_data(self, **kwargs):
@@ -64,11 +92,16 @@ class OrderListView(LoginRequiredMixin, ListView):
         context['date_from'] = self.request.GET.get('date_from', '')
         context['date_to'] = self.request.GET.get('date_to', '')
         
-        # Statistics
-        context['total_orders'] = Order.objects.count()
-        context['pending_orders'] = Order.objects.filter(status='pending').count()
-        context['processing_orders'] = Order.objects.filter(status='processing').count()
-        
+        # Statistics, computed in one aggregate instead of three COUNT queries
+        stats = Order.objects.aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(status='pending')),
+            processing=Count('id', filter=Q(status='processing')),
+        )
+        context['total_orders'] = stats['total']
+        context['pending_orders'] = stats['pending']
+        context['processing_orders'] = stats['processing']
+
         return context
 
 
@@ -95,7 +128,8 @@ class OrderCreateView(LoginRequiredMixin, CreateView):
     form_class = OrderForm
     template_name = 'orders/form.html'
     success_url = reverse_lazy('orders:list')
-    
+
+    @transaction.atomic
     def form_valid(self, form):
         form.instance.created_by = self.request.user
         
@@ -126,35 +160,36 @@ class OrderUpdateView(LoginRequiredMixin, UpdateView):
     
     def get_success_url(self):
         return reverse_lazy('orders:detail', kwargs={'pk': self.object.pk})
-    
+
+    @transaction.atomic
     def form_valid(self, form):
-        # Track changes
-        old_order = Order.objects.get(pk=self.object.pk)
-        changes = {}
-        
-        for field in ['customer_name', 'customer_email', 'customer_phone', 'customer_address', 'status']:
-            old_value = getattr(old_order, field)
-            new_value = form.cleaned_data[field]
-            if old_value != new_value:
-                changes[field] = {'old': str(old_value), 'new': str(new_value)}
-        
+        # Track changes from the form's initial data — the unmodified
+        # instance Django already loaded — instead of re-selecting the order
+        tracked_fields = ['customer_name', 'customer_email', 'customer_phone', 'customer_address', 'status']
+        changes = {
+            field: {'old': str(form.initial.get(field, '')), 'new': str(form.cleaned_data[field])}
+            for field in form.changed_data
+            if field in tracked_fields
+        }
+        status_changed = 'status' in changes
+
         # Special handling for status changes
-        if old_order.status != form.cleaned_data['status']:
+        if status_changed:
             OrderAuditLog.objects.create(
                 order=self.object,
                 user=self.request.user,
                 action='status_change',
                 details={
-                    'from': old_order.status,
+                    'from': form.initial.get('status'),
                     'to': form.cleaned_data['status'],
                     'changes': changes,
                 }
             )
-        
+
         order = form.save()
-        
+
         # Create audit log for other changes
-        if changes and old_order.status == form.cleaned_data['status']:
+        if changes and not status_changed:
             OrderAuditLog.objects.create(
                 order=order,
                 user=self.request.user,
@@ -168,6 +203,7 @@ class OrderUpdateView(LoginRequiredMixin, UpdateView):
 
 @login_required
 @user_passes_test(is_admin_or_staff)
+@transaction.atomic
 def add_order_item(request, pk):
     """Add an item to an order."""
     order = get_object_or_404(Order, pk=pk)
@@ -186,11 +222,15 @@ def add_order_item(request, pk):
             if product.quantity < quantity:
                 messages.error(request, f'Insufficient stock. Available: {product.quantity}')
             else:
-                # Check if item already exists
-                existing_item = order.items.filter(product=product).first()
-                if existing_item:
-                    existing_item.quantity += quantity
-                    existing_item.save()
+                # Increment an existing line atomically in the database so
+                # concurrent adds can't lose updates; fall back to creating
+                # the line if none was matched
+                updated = order.items.filter(product=product).update(
+                    quantity=F('quantity') + quantity,
+                    total_price=(F('quantity') + quantity) * F('unit_price'),
+                )
+                if updated:
+                    order.update_totals()
                 else:
                     OrderItem.objects.create(
                         order=order,
@@ -221,6 +261,7 @@ def add_order_item(request, pk):
 
 @login_required
 @user_passes_test(is_admin_or_staff)
+@transaction.atomic
 def remove_order_item(request, pk, item_id):
     """Remove an item from an order."""
     order = get_object_or_404(Order, pk=pk)
@@ -230,7 +271,7 @@ def remove_order_item(request, pk, item_id):
         return redirect('orders:detail', pk=order.pk)
     
     try:
-        item = OrderItem.objects.get(pk=item_id, order=order)
+        item = OrderItem.objects.select_related('product').get(pk=item_id, order=order)
         
         # Create audit log before deletion
         OrderAuditLog.objects.create(
@@ -255,6 +296,7 @@ def remove_order_item(request, pk, item_id):
 
 @login_required
 @user_passes_test(is_admin_or_staff)
+@transaction.atomic
 def process_order(request, pk):
     """Process an order (move from pending to processing)."""
     order = get_object_or_404(Order, pk=pk)
@@ -279,6 +321,7 @@ def process_order(request, pk):
 
 @login_required
 @user_passes_test(is_admin_or_staff)
+@transaction.atomic
 def ship_order(request, pk):
     """Ship an order (move from processing to shipped)."""
     order = get_object_or_404(Order, pk=pk)
@@ -287,7 +330,7 @@ def ship_order(request, pk):
         messages.error(request, 'Only processing orders can be shipped.')
     else:
         order.status = 'shipped'
-        order.save()
+        order.save(update_fields=['status', 'updated_at'])
         
         # Create audit log
         OrderAuditLog.objects.create(
@@ -304,6 +347,7 @@ def ship_order(request, pk):
 
 @login_required
 @user_passes_test(is_admin_or_staff)
+@transaction.atomic
 def deliver_order(request, pk):
     """Deliver an order (move from shipped to delivered)."""
     order = get_object_or_404(Order, pk=pk)
@@ -312,7 +356,8 @@ def deliver_order(request, pk):
         messages.error(request, 'Only shipped orders can be delivered.')
     else:
         order.status = 'delivered'
-        order.save()
+        # save() stamps completed_at for delivered orders
+        order.save(update_fields=['status', 'completed_at', 'updated_at'])
         
         # Create audit log
         OrderAuditLog.objects.create(
@@ -329,6 +374,7 @@ def deliver_order(request, pk):
 
 @login_required
 @user_passes_test(is_admin_or_staff)
+@transaction.atomic
 def cancel_order(request, pk):
     """Cancel an order."""
     order = get_object_or_404(Order, pk=pk)
@@ -354,13 +400,27 @@ def cancel_order(request, pk):
     return redirect('orders:detail', pk=order.pk)
 
 
+def _product_info_etag(request):
+    """ETag from the product's updated_at, so repeat lookups get a 304."""
+    product_id = request.GET.get('product_id')
+    try:
+        updated_at = Product.objects.filter(pk=product_id).values_list('updated_at', flat=True).first()
+    except (ValueError, ValidationError):
+        return None
+    if updated_at is None:
+        return None
+    return '"%s"' % hashlib.md5(f'{product_id}-{updated_at.timestamp()}'.encode()).hexdigest()
+
+
 @login_required
+@cache_control(private=True, max_age=30)
+@condition(etag_func=_product_info_etag)
 def get_product_info(request):
     """Get product information for order form."""
     product_id = request.GET.get('product_id')
-    
+
     try:
-        product = Product.objects.get(pk=product_id)
+        product = Product.objects.only('price', 'quantity', 'status').get(pk=product_id)
         return JsonResponse({
             'success': True,
             'price': str(product.price),
@@ -371,14 +431,53 @@ def get_product_info(request):
         return JsonResponse({'success': False, 'error': 'Product not found.'})
 
 
+class Echo:
+    """File-like object whose write() returns the value, for streaming CSV."""
+
+    def write(self, value):
+        return value
+
+
 class ExportOrdersView(LoginRequiredMixin, UserPassesTestMixin, View):
-    """Export orders to CSV."""
-    
+    """Export orders to CSV as a streaming response."""
+
     def test_func(self):
         return self.request.user.is_admin
-    
+
     def get(self, request):
-        # This would generate a CSV file
-        # For now, just return a message
-        messages.info(request, 'CSV export functionality will be implemented in production.')
-        return redirect('orders:list')
+        queryset = Order.objects.select_related('created_by', 'assigned_to').annotate(
+            items_count=Count('items')
+        ).only(
+            'order_number', 'customer_name', 'customer_email', 'status',
+            'total_amount', 'final_amount', 'created_at',
+            'created_by__email', 'assigned_to__email',
+        )
+
+        writer = csv.writer(Echo())
+
+        def rows():
+            yield writer.writerow([
+                'Order Number', 'Customer Name', 'Customer Email', 'Status',
+                'Total Amount', 'Final Amount', 'Created At', 'Created By',
+                'Assigned To', 'Items Count',
+            ])
+            # iterator() streams rows chunk by chunk instead of loading the
+            # whole table before the first byte goes out
+            for order in queryset.iterator(chunk_size=2000):
+                yield writer.writerow([
+                    order.order_number,
+                    order.customer_name,
+                    order.customer_email,
+                    order.status,
+                    str(order.total_amount),
+                    str(order.final_amount),
+                    order.created_at.strftime('%Y-%m-%d %H:%M:%S'),
+                    order.created_by.email,
+                    order.assigned_to.email if order.assigned_to else '',
+                    order.items_count,
+                ])
+
+        response = StreamingHttpResponse(rows(), content_type='text/csv')
+        filename = f'orders_export_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
@@ -0,0 +1,44 @@
+"""
+Shared Faker instances.
+
+Constructing a Faker loads every provider for the locale, which is
+expensive enough to matter when many test modules each build their own.
+Modules should call get_faker() instead of instantiating Faker directly.
+"""
+
+from collections import OrderedDict
+
+from faker import Faker
+from faker.providers import BaseProvider
+
+_faker_cache = {}
+
+_original_random_element = BaseProvider.random_element
+
+
+def _fast_random_element(self, elements=('a',)):
+    """random_element with a cached key tuple for OrderedDict providers.
+
+    The stock implementation rebuilds the choice list and walks the
+    weighted-distribution path on every call, which dominates profile time
+    in tight generation loops (phone_number, job, catch_phrase all use
+    OrderedDict providers). Picking uniformly from cached keys trades the
+    provider weighting — irrelevant for fake data — for a large speedup.
+    """
+    if isinstance(elements, OrderedDict):
+        cached = getattr(elements, '_cached_choice_list', None)
+        if cached is None:
+            cached = tuple(elements.keys())
+            elements._cached_choice_list = cached
+        return self.generator.random.choice(cached)
+    return _original_random_element(self, elements)
+
+
+BaseProvider.random_element = _fast_random_element
+
+
+def get_faker(locale='en_US'):
+    """Return a process-wide cached Faker for the given locale."""
+    if locale not in _faker_cache:
+        _faker_cache[locale] = Faker(locale)
+    return _faker_cache[locale]
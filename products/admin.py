@@ -33,6 +33,10 @@ class ProductAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        """Join category for list_display instead of one query per row."""
+        return super().get_queryset(request).select_related('category')
+
     def save_model(self, request, obj, form, change):
         """Set created_by and updated_by fields."""
         if not change:
@@ -48,7 +52,11 @@ class ProductAuditLogAdmin(admin.ModelAdmin):
     list_filter = ('action', 'timestamp')
     search_fields = ('product__sku', 'product__name', 'notes')
     readonly_fields = ('product', 'user', 'action', 'changes', 'notes', 'timestamp')
-    
+
+    def get_queryset(self, request):
+        """Join product and user for list_display instead of one query per row."""
+        return super().get_queryset(request).select_related('product', 'user')
+
     def has_add_permission(self, request):
         return False
     
@@ -2,10 +2,15 @@
 Forms for product management.
 """
 
+import re
+
 from django import forms
 from django.core.exceptions import ValidationError
 from .models import Product, Category
 
+# Accepted product image extensions, compiled once at import
+_ALLOWED_IMAGE_RE = re.compile(r'\.(?:jpe?g|png)\Z', re.IGNORECASE)
+
 
 class CategoryForm(forms.ModelForm):
     """Form for Category model."""
@@ -52,19 +57,26 @@ class ProductForm(forms.ModelForm):
             'image': forms.FileInput(attrs={'class': 'form-control'}),
             'status': forms.Select(attrs={'class': 'form-control'}),
         }
-    
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The select only renders id and name; don't fetch full category rows
+        self.fields['category'].queryset = (
+            Category.objects.only('id', 'name').order_by('name')
+        )
+
     def clean_image(self):
         image = self.cleaned_data.get('image')
         if image:
+            # Check file extension first - cheaper than the size check, which
+            # can stat the file on some storage backends
+            if not _ALLOWED_IMAGE_RE.search(image.name):
+                raise ValidationError('Only JPG and PNG images are allowed.')
+
             # Check file size (2MB limit)
             if image.size > 2 * 1024 * 1024:
                 raise ValidationError('Image file size must be under 2MB.')
-            
-            # Check file extension
-            valid_extensions = ['.jpg', '.jpeg', '.png']
-            if not any(image.name.lower().endswith(ext) for ext in valid_extensions):
-                raise ValidationError('Only JPG and PNG images are allowed.')
-        
+
         return image
     
     def clean(self):
@@ -0,0 +1,39 @@
+# Generated by Django 5.0.2 on 2026-09-01 06:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='product',
+            name='products_pr_sku_ca0cdc_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='products_pr_categor_9edb3d_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='products_pr_status_041708_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='products_pr_quantit_d0d05f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['status', 'quantity'], name='prod_status_qty_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['category', 'status'], name='prod_cat_status_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.2 on 2026-09-01 06:36
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0003_remove_product_products_pr_sku_ca0cdc_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='product',
+            name='products_pr_name_9ff0a3_idx',
+        ),
+    ]
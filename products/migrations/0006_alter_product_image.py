@@ -0,0 +1,19 @@
+# Generated by Django 5.0.2 on 2026-09-01 06:37
+
+import products.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0005_product_name_trigram_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='product',
+            name='image',
+            field=models.FileField(blank=True, null=True, upload_to=products.models.product_image_path),
+        ),
+    ]
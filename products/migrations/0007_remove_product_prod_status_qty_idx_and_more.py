@@ -0,0 +1,50 @@
+# Generated by Django 5.0.2 on 2026-09-01 06:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+STATUS_MAP = {
+    'active': '1',
+    'inactive': '2',
+    'discontinued': '3',
+    'out_of_stock': '4',
+}
+
+
+def status_to_int(apps, schema_editor):
+    """Rewrite string statuses to their integer codes while the column is
+    still a varchar, so the type change can cast the values."""
+    Product = apps.get_model('products', 'Product')
+    for old, new in STATUS_MAP.items():
+        Product.objects.filter(status=old).update(status=new)
+
+
+def status_to_str(apps, schema_editor):
+    Product = apps.get_model('products', 'Product')
+    for old, new in STATUS_MAP.items():
+        Product.objects.filter(status=new).update(status=old)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0006_alter_product_image'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='product',
+            name='prod_status_qty_idx',
+        ),
+        migrations.RunPython(status_to_int, status_to_str),
+        migrations.AlterField(
+            model_name='product',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Active'), (2, 'Inactive'), (3, 'Discontinued'), (4, 'Out of Stock')], default=1),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('status', 1)), fields=['status', 'quantity'], name='prod_status_qty_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.2 on 2026-09-01 06:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0007_remove_product_prod_status_qty_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='product',
+            constraint=models.CheckConstraint(check=models.Q(('price__gte', models.F('cost'))), name='price_gte_cost'),
+        ),
+        migrations.AddConstraint(
+            model_name='product',
+            constraint=models.CheckConstraint(check=models.Q(('max_quantity__gt', models.F('min_quantity'))), name='maxq_gt_minq'),
+        ),
+        migrations.AddConstraint(
+            model_name='product',
+            constraint=models.CheckConstraint(check=models.Q(('quantity__gte', 0)), name='qty_nonneg'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+"""
+Trigram GIN indexes for the remaining product search fields.
+
+The list view ORs icontains filters over sku, name and description; name
+got its trigram index earlier, these cover the other two. PostgreSQL-only:
+other backends (the sqlite dev/test database) skip this migration's SQL
+entirely.
+"""
+
+from django.db import migrations
+
+CREATE_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS products_product_sku_trgm_idx "
+    "ON products_product USING gin (sku gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS products_product_desc_trgm_idx "
+    "ON products_product USING gin (description gin_trgm_ops)",
+]
+
+DROP_SQL = [
+    "DROP INDEX IF EXISTS products_product_sku_trgm_idx",
+    "DROP INDEX IF EXISTS products_product_desc_trgm_idx",
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for sql in CREATE_SQL:
+        schema_editor.execute(sql)
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for sql in DROP_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0008_product_price_gte_cost_product_maxq_gt_minq_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
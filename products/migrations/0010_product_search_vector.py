@@ -0,0 +1,52 @@
+"""
+Precomputed full-text search column for products.
+
+Adds a stored generated tsvector over sku/name (weight A) and description
+(weight B) plus a GIN index, so the list view's search can probe the index
+instead of running three ORed ILIKE scans. PostgreSQL-only: the column is
+kept out of the model and other backends (the sqlite dev/test database)
+skip this migration's SQL entirely; the view falls back to icontains there.
+"""
+
+from django.db import migrations
+
+CREATE_SQL = [
+    "ALTER TABLE products_product ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('english', coalesce(sku, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+    ") STORED",
+    "CREATE INDEX IF NOT EXISTS products_product_search_idx "
+    "ON products_product USING gin (search_vector)",
+]
+
+DROP_SQL = [
+    "DROP INDEX IF EXISTS products_product_search_idx",
+    "ALTER TABLE products_product DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def create_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for sql in CREATE_SQL:
+        schema_editor.execute(sql)
+
+
+def drop_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for sql in DROP_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0009_product_sku_description_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_vector, drop_search_vector),
+    ]
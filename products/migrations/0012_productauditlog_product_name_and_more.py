@@ -0,0 +1,42 @@
+# Generated by Django 5.0.2 on 2026-09-01 07:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_product_fields(apps, schema_editor):
+    """Copy sku/name from the product onto existing audit rows."""
+    Product = apps.get_model('products', 'Product')
+    ProductAuditLog = apps.get_model('products', 'ProductAuditLog')
+    product = Product.objects.filter(pk=OuterRef('product_id'))
+    ProductAuditLog.objects.filter(product__isnull=False).update(
+        product_sku=Subquery(product.values('sku')[:1]),
+        product_name=Subquery(product.values('name')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0011_product_prod_status_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productauditlog',
+            name='product_name',
+            field=models.CharField(blank=True, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='productauditlog',
+            name='product_sku',
+            field=models.CharField(blank=True, max_length=50),
+        ),
+        migrations.RunPython(backfill_product_fields, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='productauditlog',
+            name='product',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='audit_logs', to='products.product'),
+        ),
+    ]
@@ -4,6 +4,7 @@ Product models for the ecommerce system.
 
 import uuid
 import os
+from functools import cached_property
 from django.db import models
 from django.core.validators import MinValueValidator
 from django.core.exceptions import ValidationError
@@ -40,13 +41,16 @@ class Category(models.Model):
 
 class Product(models.Model):
     """Product model."""
-    
-    STATUS_CHOICES = [
-        ('active', 'Active'),
-        ('inactive', 'Inactive'),
-        ('discontinued', 'Discontinued'),
-        ('out_of_stock', 'Out of Stock'),
-    ]
+
+    class Status(models.IntegerChoices):
+        """Stored as a small integer: status sits in two indexes and every
+        row, so 2 bytes beat a 6-12 byte string with string compares."""
+        ACTIVE = 1, 'Active'
+        INACTIVE = 2, 'Inactive'
+        DISCONTINUED = 3, 'Discontinued'
+        OUT_OF_STOCK = 4, 'Out of Stock'
+
+    STATUS_CHOICES = Status.choices
     
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     sku = models.CharField(max_length=50, unique=True)
@@ -58,8 +62,11 @@ class Product(models.Model):
     quantity = models.IntegerField(default=0, validators=[MinValueValidator(0)])
     min_quantity = models.IntegerField(default=10, validators=[MinValueValidator(0)])
     max_quantity = models.IntegerField(default=1000, validators=[MinValueValidator(1)])
-    image = models.ImageField(upload_to=product_image_path, blank=True, null=True)
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='active')
+    # FileField rather than ImageField: ProductForm already restricts
+    # uploads to jpg/png and caps the size, so Pillow's decode-on-validate
+    # pass would only repeat that work on every save.
+    image = models.FileField(upload_to=product_image_path, blank=True, null=True)
+    status = models.PositiveSmallIntegerField(choices=Status.choices, default=Status.ACTIVE)
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name='products_created')
     updated_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name='products_updated')
     created_at = models.DateTimeField(auto_now_add=True)
@@ -67,32 +74,53 @@ class Product(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        # sku already has a unique btree from unique=True, and search uses
+        # icontains, which a btree on name can't serve — that lookup is
+        # covered by a trigram GIN index created in a Postgres-only
+        # migration. The partial (status, quantity) index serves the
+        # availability/restock predicates over active products only, and
+        # (category, status) covers the list view's category filter; both
+        # subsume the old single-column category/status/quantity indexes.
         indexes = [
-            models.Index(fields=['sku']),
-            models.Index(fields=['name']),
-            models.Index(fields=['category']),
-            models.Index(fields=['status']),
-            models.Index(fields=['quantity']),
+            models.Index(
+                fields=['status', 'quantity'],
+                name='prod_status_qty_idx',
+                condition=models.Q(status=1),  # Status.ACTIVE
+            ),
+            models.Index(fields=['category', 'status'], name='prod_cat_status_idx'),
             models.Index(fields=['created_at']),
+            # Serves the list page's ?status= filter in its display order
+            models.Index(fields=['status', '-created_at'], name='prod_status_created_idx'),
+        ]
+        # Business rules as CHECK constraints: enforced atomically in the
+        # database for every write path (including bulk_create), and still
+        # surfaced as ValidationError via full_clean's constraint validation.
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(price__gte=models.F('cost')),
+                name='price_gte_cost',
+            ),
+            models.CheckConstraint(
+                check=models.Q(max_quantity__gt=models.F('min_quantity')),
+                name='maxq_gt_minq',
+            ),
+            models.CheckConstraint(
+                check=models.Q(quantity__gte=0),
+                name='qty_nonneg',
+            ),
         ]
     
     def __str__(self):
         return f"{self.sku} - {self.name}"
     
-    def clean(self):
-        """Validate product data."""
-        if self.price < self.cost:
-            raise ValidationError('Price must be greater than or equal to cost.')
-        
-        if self.quantity < 0:
-            raise ValidationError('Quantity cannot be negative.')
-        
-        if self.max_quantity <= self.min_quantity:
-            raise ValidationError('Maximum quantity must be greater than minimum quantity.')
-    
-    @property
+    @cached_property
     def margin(self):
-        """Calculate profit margin."""
+        """Calculate profit margin.
+
+        Cached per instance: the Decimal division is paid once even when a
+        template renders it several times. Price and cost don't change
+        within a request; a refreshed instance recomputes.
+        """
         if self.price > 0:
             return ((self.price - self.cost) / self.price) * 100
         return 0
@@ -105,17 +133,43 @@ class Product(models.Model):
     @property
     def is_available(self):
         """Check if product is available for purchase."""
-        return self.status == 'active' and self.quantity > 0
+        return self.status == self.Status.ACTIVE and self.quantity > 0
     
     def decrement_quantity(self, amount):
-        """Decrement product quantity."""
-        if amount > self.quantity:
+        """Atomically decrement product quantity.
+
+        The stock check and decrement run in one guarded UPDATE, so
+        concurrent decrements cannot oversell and only the two touched
+        columns are written instead of the full row.
+        """
+        updated = Product.objects.filter(pk=self.pk, quantity__gte=amount).update(
+            quantity=models.F('quantity') - amount,
+            status=models.Case(
+                models.When(quantity__lte=amount, then=models.Value(self.Status.OUT_OF_STOCK)),
+                default=models.F('status'),
+                output_field=models.PositiveSmallIntegerField(),
+            ),
+        )
+        if not updated:
             raise ValidationError(f'Insufficient stock. Available: {self.quantity}')
-        
-        self.quantity -= amount
-        if self.quantity <= 0:
-            self.status = 'out_of_stock'
-        self.save()
+        self.refresh_from_db(fields=['quantity', 'status'])
+
+    def restock(self, amount):
+        """Atomically add stock.
+
+        Mirrors decrement_quantity: one UPDATE with F() so two concurrent
+        restocks both land instead of the last read-modify-write winning,
+        and an out-of-stock product flips back to active.
+        """
+        Product.objects.filter(pk=self.pk).update(
+            quantity=models.F('quantity') + amount,
+            status=models.Case(
+                models.When(status=self.Status.OUT_OF_STOCK, then=models.Value(self.Status.ACTIVE)),
+                default=models.F('status'),
+                output_field=models.PositiveSmallIntegerField(),
+            ),
+        )
+        self.refresh_from_db(fields=['quantity', 'status'])
 
 
 class ProductAuditLog(models.Model):
@@ -130,7 +184,11 @@ class ProductAuditLog(models.Model):
     ]
     
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='audit_logs')
+    # SET_NULL so audit history survives product deletion; sku/name are
+    # denormalized below to keep the rows identifiable afterwards
+    product = models.ForeignKey(Product, on_delete=models.SET_NULL, null=True, related_name='audit_logs')
+    product_sku = models.CharField(max_length=50, blank=True)
+    product_name = models.CharField(max_length=200, blank=True)
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True)
     action = models.CharField(max_length=20, choices=ACTION_CHOICES)
     changes = models.JSONField(default=dict)
@@ -145,4 +203,4 @@ class ProductAuditLog(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.product.sku} - {self.action} - {self.timestamp}"
+        return f"{self.product_sku} - {self.action} - {self.timestamp}"
@@ -3,8 +3,16 @@ Permission utilities for products app.
 """
 
 def is_admin_or_staff(user):
-    """Check if user is admin or staff member."""
-    return user.is_authenticated and (user.is_admin or user.is_staff_member)
+    """Check if user is admin or staff member.
+
+    Memoized on the user instance: decorators, mixins and templates often
+    re-check the same user several times within one request.
+    """
+    cached = getattr(user, '_is_admin_or_staff', None)
+    if cached is None:
+        cached = user.is_authenticated and (user.is_admin or user.is_staff_member)
+        user._is_admin_or_staff = cached
+    return cached
 
 
 def can_view_products(user):
@@ -0,0 +1,33 @@
+"""
+Signals for products app.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Category, ProductAuditLog
+
+CATEGORIES_CACHE_KEY = 'categories:all'
+
+
+def product_audit_cache_key(product_id):
+    """Cache key for a product's recent audit log list."""
+    return f'paudit:{product_id}'
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_cache(sender, **kwargs):
+    """Drop the cached category list whenever a category changes."""
+    cache.delete(CATEGORIES_CACHE_KEY)
+
+
+@receiver(post_save, sender=ProductAuditLog)
+def invalidate_product_audit_cache(sender, instance, **kwargs):
+    """Drop a product's cached audit list when a log row is saved directly.
+
+    Buffered audit rows land via bulk_create, which skips this signal;
+    the views that buffer delete the key themselves.
+    """
+    cache.delete(product_audit_cache_key(instance.product_id))
@@ -6,18 +6,16 @@ from django.test import TestCase
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
-from faker import Faker
 
 from products.models import Category, Product, ProductAuditLog
 
-fake = Faker()
-
 
 class CategoryModelTests(TestCase):
     """Test Category model."""
-    
-    def setUp(self):
-        self.category = Category.objects.create(
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(
             name='Electronics',
             description='Electronic devices and accessories'
         )
@@ -40,29 +38,30 @@ class CategoryModelTests(TestCase):
 
 class ProductModelTests(TestCase):
     """Test Product model."""
-    
-    def setUp(self):
-        self.User = get_user_model()
-        self.user = self.User.objects.create_user(
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.User = get_user_model()
+        cls.user = cls.User.objects.create_user(
             email='test@example.com',
             password='test123'
         )
-        
-        self.category = Category.objects.create(name='Electronics')
-        
-        self.product_data = {
+
+        cls.category = Category.objects.create(name='Electronics')
+
+        cls.product_data = {
             'sku': 'TEST-001',
             'name': 'Test Product',
             'description': 'Test product description',
-            'category': self.category,
+            'category': cls.category,
             'price': 99.99,
             'cost': 49.99,
             'quantity': 100,
             'min_quantity': 10,
             'max_quantity': 1000,
-            'status': 'active',
-            'created_by': self.user,
-            'updated_by': self.user,
+            'status': Product.Status.ACTIVE,
+            'created_by': cls.user,
+            'updated_by': cls.user,
         }
     
     def test_create_product(self):
@@ -136,16 +135,16 @@ class ProductModelTests(TestCase):
         product = Product.objects.create(**self.product_data)
         
         # Active with stock
-        product.status = 'active'
+        product.status = Product.Status.ACTIVE
         product.quantity = 10
         self.assertTrue(product.is_available)
         
         # Inactive
-        product.status = 'inactive'
+        product.status = Product.Status.INACTIVE
         self.assertFalse(product.is_available)
         
         # Out of stock
-        product.status = 'active'
+        product.status = Product.Status.ACTIVE
         product.quantity = 0
         self.assertFalse(product.is_available)
     
@@ -153,7 +152,8 @@ class ProductModelTests(TestCase):
         """Test decrement_quantity method."""
         product = Product.objects.create(**self.product_data)
         product.quantity = 50
-        
+        product.save()
+
         # Valid decrement
         product.decrement_quantity(10)
         product.refresh_from_db()
@@ -167,51 +167,71 @@ class ProductModelTests(TestCase):
         """Test decrementing to zero changes status."""
         product = Product.objects.create(**self.product_data)
         product.quantity = 5
-        
+        product.save()
+
         product.decrement_quantity(5)
         product.refresh_from_db()
         
         self.assertEqual(product.quantity, 0)
-        self.assertEqual(product.status, 'out_of_stock')
+        self.assertEqual(product.status, Product.Status.OUT_OF_STOCK)
 
 
 class ProductAuditLogModelTests(TestCase):
     """Test ProductAuditLog model."""
-    
-    def setUp(self):
-        self.User = get_user_model()
-        self.user = self.User.objects.create_user(
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.User = get_user_model()
+        cls.user = cls.User.objects.create_user(
             email='test@example.com',
             password='test123'
         )
-        
-        self.category = Category.objects.create(name='Electronics')
-        
-        self.product = Product.objects.create(
+
+        cls.category = Category.objects.create(name='Electronics')
+
+        cls.product = Product.objects.create(
             sku='TEST-001',
             name='Test Product',
             description='Test description',
-            category=self.category,
+            category=cls.category,
             price=99.99,
             cost=49.99,
             quantity=100,
-            created_by=self.user,
-            updated_by=self.user,
+            created_by=cls.user,
+            updated_by=cls.user,
         )
     
     def test_create_audit_log(self):
         """Test creating audit log."""
         audit_log = ProductAuditLog.objects.create(
             product=self.product,
+            product_sku=self.product.sku,
+            product_name=self.product.name,
             user=self.user,
             action='create',
             changes={'field': 'value'},
             notes='Test notes',
         )
-        
+
         self.assertEqual(audit_log.product, self.product)
         self.assertEqual(audit_log.user, self.user)
         self.assertEqual(audit_log.action, 'create')
         self.assertEqual(audit_log.changes, {'field': 'value'})
         self.assertEqual(audit_log.notes, 'Test notes')
         self.assertEqual(str(audit_log), f"{self.product.sku} - create - {audit_log.timestamp}")
+
+    def test_audit_log_survives_product_delete(self):
+        """Deleting the product keeps its audit rows, identified by sku."""
+        audit_log = ProductAuditLog.objects.create(
+            product=self.product,
+            product_sku=self.product.sku,
+            product_name=self.product.name,
+            user=self.user,
+            action='update',
+        )
+
+        self.product.delete()
+        audit_log.refresh_from_db()
+
+        self.assertIsNone(audit_log.product)
+        self.assertEqual(audit_log.product_sku, 'TEST-001')
@@ -2,56 +2,56 @@
 Tests for products views.
 """
 
+from django.core.cache import cache
 from django.test import TestCase, Client
 from django.urls import reverse
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.contrib.auth import get_user_model
-from faker import Faker
 
-from products.models import Category, Product
-
-fake = Faker()
+from products.models import Category, Product, ProductAuditLog
+from products.signals import CATEGORIES_CACHE_KEY
 
 
 class ProductListViewTests(TestCase):
     """Test product list view."""
-    
-    def setUp(self):
-        self.client = Client()
-        self.User = get_user_model()
-        self.user = self.User.objects.create_user(
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.User = get_user_model()
+        cls.user = cls.User.objects.create_user(
             email='test@example.com',
             password='testpass123'
         )
-        
-        self.category = Category.objects.create(name='Electronics')
-        
-        # Create test products
-        self.product1 = Product.objects.create(
-            sku='TEST-001',
-            name='Product 1',
-            description='Description 1',
-            category=self.category,
-            price=99.99,
-            cost=49.99,
-            quantity=100,
-            created_by=self.user,
-            updated_by=self.user,
-        )
-        
-        self.product2 = Product.objects.create(
-            sku='TEST-002',
-            name='Product 2',
-            description='Description 2',
-            category=self.category,
-            price=199.99,
-            cost=99.99,
-            quantity=50,
-            created_by=self.user,
-            updated_by=self.user,
-        )
-        
-        self.list_url = reverse('products:list')
+
+        cls.category = Category.objects.create(name='Electronics')
+
+        # Create test products in one INSERT
+        cls.product1, cls.product2 = Product.objects.bulk_create([
+            Product(
+                sku='TEST-001',
+                name='Product 1',
+                description='Description 1',
+                category=cls.category,
+                price=99.99,
+                cost=49.99,
+                quantity=100,
+                created_by=cls.user,
+                updated_by=cls.user,
+            ),
+            Product(
+                sku='TEST-002',
+                name='Product 2',
+                description='Description 2',
+                category=cls.category,
+                price=199.99,
+                cost=99.99,
+                quantity=50,
+                created_by=cls.user,
+                updated_by=cls.user,
+            ),
+        ])
+
+        cls.list_url = reverse('products:list')
     
     def test_product_list_requires_login(self):
         """Test product list requires authentication."""
@@ -69,6 +69,40 @@ class ProductListViewTests(TestCase):
         self.assertContains(response, 'Product 2')
         self.assertEqual(len(response.context['products']), 2)
     
+    def test_product_list_query_count(self):
+        """Query count is pinned so a template N+1 fails here."""
+        self.client.force_login(self.user)
+        # Start from a cold category cache so the count is deterministic.
+        cache.delete(CATEGORIES_CACHE_KEY)
+        with self.assertNumQueries(4):
+            self.client.get(self.list_url)
+        # A second hit serves the category dropdown from cache.
+        with self.assertNumQueries(3):
+            self.client.get(self.list_url)
+
+    def test_product_list_keyset_pagination(self):
+        """Follow the `after` cursor through to the last page."""
+        Product.objects.bulk_create([
+            Product(
+                sku=f'PAGE-{i:03d}',
+                name=f'Paged Product {i}',
+                category=self.category,
+                price=10,
+                cost=5,
+                quantity=1,
+            )
+            for i in range(25)
+        ])
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.list_url)
+        self.assertEqual(len(response.context['products']), 20)
+        self.assertIn('next_cursor', response.context)
+
+        response = self.client.get(self.list_url, {'after': response.context['next_cursor']})
+        self.assertEqual(len(response.context['products']), 7)
+        self.assertNotIn('next_cursor', response.context)
+
     def test_product_list_search(self):
         """Test product list with search."""
         self.client.force_login(self.user)
@@ -96,30 +130,30 @@ class ProductListViewTests(TestCase):
 
 class ProductDetailViewTests(TestCase):
     """Test product detail view."""
-    
-    def setUp(self):
-        self.client = Client()
-        self.User = get_user_model()
-        self.user = self.User.objects.create_user(
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.User = get_user_model()
+        cls.user = cls.User.objects.create_user(
             email='test@example.com',
             password='testpass123'
         )
-        
-        self.category = Category.objects.create(name='Electronics')
-        
-        self.product = Product.objects.create(
+
+        cls.category = Category.objects.create(name='Electronics')
+
+        cls.product = Product.objects.create(
             sku='TEST-001',
             name='Test Product',
             description='Test description',
-            category=self.category,
+            category=cls.category,
             price=99.99,
             cost=49.99,
             quantity=100,
-            created_by=self.user,
-            updated_by=self.user,
+            created_by=cls.user,
+            updated_by=cls.user,
         )
-        
-        self.detail_url = reverse('products:detail', kwargs={'pk': self.product.pk})
+
+        cls.detail_url = reverse('products:detail', kwargs={'pk': cls.product.pk})
     
     def test_product_detail_requires_login(self):
         """Test product detail requires authentication."""
@@ -140,26 +174,26 @@ class ProductDetailViewTests(TestCase):
 
 class ProductCreateViewTests(TestCase):
     """Test product create view."""
-    
-    def setUp(self):
-        self.client = Client()
-        self.User = get_user_model()
-        
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.User = get_user_model()
+
         # Create staff user
-        self.staff_user = self.User.objects.create_user(
+        cls.staff_user = cls.User.objects.create_user(
             email='staff@example.com',
             password='testpass123',
             is_staff=True
         )
-        
+
         # Create regular user
-        self.regular_user = self.User.objects.create_user(
+        cls.regular_user = cls.User.objects.create_user(
             email='user@example.com',
             password='testpass123'
         )
-        
-        self.category = Category.objects.create(name='Electronics')
-        self.create_url = reverse('products:create')
+
+        cls.category = Category.objects.create(name='Electronics')
+        cls.create_url = reverse('products:create')
     
     def test_product_create_requires_login(self):
         """Test product create requires authentication."""
@@ -195,7 +229,7 @@ class ProductCreateViewTests(TestCase):
             'quantity': 50,
             'min_quantity': 5,
             'max_quantity': 500,
-            'status': 'active',
+            'status': Product.Status.ACTIVE,
         }
         
         response = self.client.post(self.create_url, data)
@@ -207,3 +241,43 @@ class ProductCreateViewTests(TestCase):
         product = Product.objects.get(sku='NEW-001')
         self.assertEqual(product.name, 'New Product')
         self.assertEqual(product.created_by, self.staff_user)
+
+
+class ProductDeleteViewTests(TestCase):
+    """Test product delete view."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.User = get_user_model()
+
+        # Deletion requires an admin
+        cls.admin_user = cls.User.objects.create_superuser(
+            email='admin@example.com',
+            password='testpass123'
+        )
+
+        cls.category = Category.objects.create(name='Electronics')
+        cls.product = Product.objects.create(
+            sku='DEL-001',
+            name='Doomed Product',
+            category=cls.category,
+            price=99.99,
+            cost=49.99,
+            quantity=10,
+        )
+        cls.delete_url = reverse('products:delete', kwargs={'pk': cls.product.pk})
+
+    def test_product_delete_view_post(self):
+        """Deleting through the view removes the product and logs it."""
+        self.client.force_login(self.admin_user)
+        response = self.client.post(self.delete_url)
+
+        self.assertRedirects(response, reverse('products:list'))
+        self.assertFalse(Product.objects.filter(pk=self.product.pk).exists())
+
+        # The buffered audit entry flushed at request end, with the FK
+        # already NULL and the identity denormalized
+        audit_log = ProductAuditLog.objects.get(action='delete')
+        self.assertIsNone(audit_log.product)
+        self.assertEqual(audit_log.product_sku, 'DEL-001')
+        self.assertEqual(audit_log.product_name, 'Doomed Product')
@@ -2,19 +2,28 @@
 Views for product management.
 """
 
+import uuid
+from datetime import datetime
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
-from django.core.paginator import Paginator
+from django.contrib.postgres.search import SearchQuery, SearchVectorField
+from django.core.cache import cache
+from django.db import connection
 from django.db.models import Q
+from django.db.models.expressions import RawSQL
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
 from django.urls import reverse_lazy
+from django.utils.cache import patch_cache_control
 from django.utils.decorators import method_decorator
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 
 from .models import Product, Category, ProductAuditLog
 from .forms import ProductForm, CategoryForm
 from .permissions import is_admin_or_staff
+from .signals import CATEGORIES_CACHE_KEY, product_audit_cache_key
+from users import audit
 
 
 class ProductListView(LoginRequiredMixin, ListView):
@@ -23,35 +32,99 @@ class ProductListView(LoginRequiredMixin, ListView):
     model = Product
     template_name = 'products/list.html'
     context_object_name = 'products'
-    paginate_by = 20
-    
+    # Keyset pagination: pages are addressed by an `after` cursor
+    # (created_at:id of the last row shown) instead of LIMIT/OFFSET, so
+    # deep pages stay O(page size) and no COUNT(*) runs per request.
+    page_size = 20
+
     def get_queryset(self):
-        queryset = Product.objects.select_related('category').order_by('-created_at')
-        
-        # Search
+        # The list template only renders these columns; skip the rest
+        # (notably the description TEXT) to keep result rows small.
+        queryset = Product.objects.select_related('category').only(
+            'sku', 'name', 'price', 'quantity', 'min_quantity', 'status',
+            'created_at', 'category__name',
+        ).order_by('-created_at', '-id')
+
+        # Collect all conditions into one Q and filter once: with no params
+        # the queryset stays clone-free and WHERE-free, so the common
+        # unfiltered page is served straight off the (created_at, id) sort.
+        filters = Q()
+
+        # Search. On PostgreSQL this probes the precomputed tsvector column
+        # (migration 0010) through its GIN index; elsewhere it falls back to
+        # the icontains OR. Results keep the recency ordering: the cursor
+        # below paginates on (created_at, id), which a rank sort would break.
         search = self.request.GET.get('search', '')
         if search:
-            queryset = queryset.filter(
-                Q(sku__icontains=search) |
-                Q(name__icontains=search) |
-                Q(description__icontains=search)
-            )
-        
+            if connection.vendor == 'postgresql':
+                vector = RawSQL('search_vector', (), output_field=SearchVectorField())
+                queryset = queryset.annotate(search=vector)
+                filters &= Q(search=SearchQuery(search, config='english'))
+            else:
+                filters &= (
+                    Q(sku__icontains=search) |
+                    Q(name__icontains=search) |
+                    Q(description__icontains=search)
+                )
+
         # Filter by category
         category = self.request.GET.get('category', '')
         if category:
-            queryset = queryset.filter(category_id=category)
-        
-        # Filter by status
+            filters &= Q(category_id=category)
+
+        # Filter by status; non-numeric values are ignored
         status = self.request.GET.get('status', '')
         if status:
-            queryset = queryset.filter(status=status)
-        
+            try:
+                filters &= Q(status=int(status))
+            except ValueError:
+                pass
+
+        cursor = self._decode_cursor(self.request.GET.get('after', ''))
+        if cursor is not None:
+            after_ts, after_id = cursor
+            filters &= (
+                Q(created_at__lt=after_ts) |
+                Q(created_at=after_ts, id__lt=after_id)
+            )
+
+        if filters:
+            queryset = queryset.filter(filters)
+
         return queryset
-    
+
+    @staticmethod
+    def _decode_cursor(raw):
+        """Parse an `after` cursor ("<iso timestamp>:<uuid>"); None if bad."""
+        if not raw:
+            return None
+        ts_raw, _, id_raw = raw.rpartition(':')
+        try:
+            return datetime.fromisoformat(ts_raw), uuid.UUID(id_raw)
+        except ValueError:
+            return None
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['categories'] = Category.objects.all()
+        # Fetch one extra row to learn whether a next page exists, and
+        # emit its cursor from the last row actually shown.
+        products = list(self.object_list[:self.page_size + 1])
+        has_next = len(products) > self.page_size
+        products = products[:self.page_size]
+        context['products'] = context['object_list'] = products
+        if has_next:
+            last = products[-1]
+            context['next_cursor'] = f"{last.created_at.isoformat()}:{last.pk}"
+        params = self.request.GET.copy()
+        params.pop('after', None)
+        context['filter_query'] = params.urlencode()
+        # Categories rarely change; serve the dropdown from cache and let
+        # the Category signals invalidate it on writes.
+        categories = cache.get(CATEGORIES_CACHE_KEY)
+        if categories is None:
+            categories = list(Category.objects.only('id', 'name'))
+            cache.set(CATEGORIES_CACHE_KEY, categories, 3600)
+        context['categories'] = categories
         context['status_choices'] = Product.STATUS_CHOICES
         context['search'] = self.request.GET.get('search', '')
         context['selected_category'] = self.request.GET.get('category', '')
@@ -65,10 +138,18 @@ class ProductDetailView(LoginRequiredMixin, DetailView):
     model = Product
     template_name = 'products/detail.html'
     context_object_name = 'product'
-    
+    queryset = Product.objects.select_related('category')
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['audit_logs'] = self.object.audit_logs.all()[:10]
+        # Detail pages are read far more often than products change; serve
+        # the recent-audit list from cache for up to a minute.
+        key = product_audit_cache_key(self.object.pk)
+        audit_logs = cache.get(key)
+        if audit_logs is None:
+            audit_logs = list(self.object.audit_logs.select_related('user')[:10])
+            cache.set(key, audit_logs, 60)
+        context['audit_logs'] = audit_logs
         return context
 
 
@@ -89,8 +170,10 @@ class ProductCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
         
         # Create audit log
         product = form.save()
-        ProductAuditLog.objects.create(
+        audit.log(ProductAuditLog(
             product=product,
+            product_sku=product.sku,
+            product_name=product.name,
             user=self.request.user,
             action='create',
             changes={
@@ -99,8 +182,8 @@ class ProductCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
                 'price': str(product.price),
                 'quantity': product.quantity,
             }
-        )
-        
+        ))
+
         messages.success(self.request, 'Product created successfully.')
         return super().form_valid(form)
 
@@ -118,14 +201,22 @@ class ProductUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
     
     def get_success_url(self):
         return reverse_lazy('products:detail', kwargs={'pk': self.object.pk})
-    
+
+    def get_object(self, queryset=None):
+        # Snapshot the pre-form values so form_valid can diff without
+        # refetching the row.
+        obj = super().get_object(queryset)
+        obj._original_values = {
+            field: getattr(obj, field)
+            for field in ('sku', 'name', 'price', 'quantity', 'status')
+        }
+        return obj
+
     def form_valid(self, form):
-        # Track changes
-        old_product = Product.objects.get(pk=self.object.pk)
+        # Track changes against the values loaded in get_object
         changes = {}
-        
-        for field in ['sku', 'name', 'price', 'quantity', 'status']:
-            old_value = getattr(old_product, field)
+
+        for field, old_value in self.object._original_values.items():
             new_value = form.cleaned_data[field]
             if old_value != new_value:
                 changes[field] = {'old': str(old_value), 'new': str(new_value)}
@@ -135,14 +226,18 @@ class ProductUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
         
         # Create audit log if there were changes
         if changes:
-            ProductAuditLog.objects.create(
+            audit.log(ProductAuditLog(
                 product=product,
+                product_sku=product.sku,
+                product_name=product.name,
                 user=self.request.user,
                 action='update',
                 changes=changes,
                 notes=form.cleaned_data.get('audit_notes', '')
-            )
-        
+            ))
+            # Buffered writes skip the post_save invalidation signal
+            cache.delete(product_audit_cache_key(product.pk))
+
         messages.success(self.request, 'Product updated successfully.')
         return super().form_valid(form)
 
@@ -158,22 +253,26 @@ class ProductDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
     def test_func(self):
         return self.request.user.is_admin
     
-    def delete(self, request, *args, **kwargs):
-        product = self.get_object()
-        
-        # Create audit log before deletion
-        ProductAuditLog.objects.create(
-            product=product,
-            user=request.user,
+    def form_valid(self, form):
+        product = self.object
+
+        # The FK is written as NULL up front (the row is gone by the time
+        # the buffered insert runs); the denormalized sku/name keep the
+        # entry identifiable.
+        audit.log(ProductAuditLog(
+            product=None,
+            product_sku=product.sku,
+            product_name=product.name,
+            user=self.request.user,
             action='delete',
             changes={
                 'sku': product.sku,
                 'name': product.name,
             }
-        )
-        
-        messages.success(request, 'Product deleted successfully.')
-        return super().delete(request, *args, **kwargs)
+        ))
+
+        messages.success(self.request, 'Product deleted successfully.')
+        return super().form_valid(form)
 
 
 @login_required
@@ -181,24 +280,24 @@ class ProductDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
 def restock_product(request, pk):
     """Restock a product."""
     product = get_object_or_404(Product, pk=pk)
-    
+
     if request.method == 'POST':
-        quantity = int(request.POST.get('quantity', 0))
-        
+        # Digit check instead of try/except: non-numeric input is just
+        # rejected below, no exception on the hot path
+        qty_raw = request.POST.get('quantity', '0')
+        quantity = int(qty_raw) if qty_raw.isdigit() else 0
+
         if quantity <= 0:
             messages.error(request, 'Quantity must be greater than 0.')
         else:
             old_quantity = product.quantity
-            product.quantity += quantity
-            
-            if product.status == 'out_of_stock' and product.quantity > 0:
-                product.status = 'active'
-            
-            product.save()
-            
+            product.restock(quantity)
+
             # Create audit log
-            ProductAuditLog.objects.create(
+            audit.log(ProductAuditLog(
                 product=product,
+                product_sku=product.sku,
+                product_name=product.name,
                 user=request.user,
                 action='restock',
                 changes={
@@ -207,12 +306,18 @@ def restock_product(request, pk):
                     'new_quantity': product.quantity,
                 },
                 notes=request.POST.get('notes', '')
-            )
-            
+            ))
+            # Buffered writes skip the post_save invalidation signal
+            cache.delete(product_audit_cache_key(product.pk))
+
             messages.success(request, f'Product restocked successfully. New quantity: {product.quantity}')
             return redirect('products:detail', pk=product.pk)
     
-    return render(request, 'products/restock.html', {'product': product})
+    # Let the browser reuse the form for 30s (e.g. back/refresh) without
+    # re-hitting the DB
+    response = render(request, 'products/restock.html', {'product': product})
+    patch_cache_control(response, private=True, max_age=30)
+    return response
 
 
 class CategoryListView(LoginRequiredMixin, ListView):
@@ -0,0 +1,47 @@
+"""
+Request-scoped buffering for audit log writes.
+
+Audit rows (users.AuditLog, products.ProductAuditLog) are queued during a
+request and written with one bulk_create per model when the request
+finishes, instead of one INSERT per event. Outside a request — shell,
+management commands, tests calling model methods directly — there is no
+buffer and entries are written immediately.
+
+Buffered rows land just after the response, outside any view transaction:
+an audit entry is never worth rolling a mutation back for.
+"""
+
+import threading
+from collections import defaultdict
+
+from django.core.signals import request_finished, request_started
+from django.dispatch import receiver
+
+_local = threading.local()
+
+
+def log(entry):
+    """Queue an unsaved audit row, or write it immediately outside a request."""
+    buffer = getattr(_local, 'buffer', None)
+    if buffer is None:
+        entry.save()
+    else:
+        buffer.append(entry)
+
+
+@receiver(request_started)
+def _open_buffer(sender, **kwargs):
+    _local.buffer = []
+
+
+@receiver(request_finished)
+def _flush_buffer(sender, **kwargs):
+    buffer = getattr(_local, 'buffer', None)
+    _local.buffer = None
+    if not buffer:
+        return
+    groups = defaultdict(list)
+    for entry in buffer:
+        groups[type(entry)].append(entry)
+    for model, rows in groups.items():
+        model.objects.bulk_create(rows, batch_size=500)
@@ -60,7 +60,15 @@ class User(AbstractUser):
     
     def __str__(self):
         return self.email
-    
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Snapshot the loaded values so change tracking can diff without
+        refetching the row on every save."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
     @property
     def is_viewer(self):
         """Check if user has viewer permissions."""
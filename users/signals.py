@@ -2,69 +2,114 @@
 Signals for user app.
 """
 
+import operator
+from dataclasses import dataclass
+
 from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
 from django.contrib.auth.signals import user_logged_in, user_logged_out
 from django.utils import timezone
 
+from . import audit
 from .models import User, AuditLog
 
+# Fields whose changes are recorded in the audit log
+TRACKED_FIELDS = ('email', 'first_name', 'last_name', 'phone', 'department', 'position', 'is_active')
+
+# attrgetter batches the per-field lookups in C; this handler runs on
+# every User save
+_get_tracked = operator.attrgetter(*TRACKED_FIELDS)
+
+
+@dataclass(slots=True)
+class ChangeSet:
+    """Changed tracked fields from one save, held as parallel tuples.
+
+    Slots-backed so stashing it on the instance costs three tuple refs,
+    not a per-save dict; it is expanded to the audit JSON shape only when
+    a log row is actually built.
+    """
+
+    fields: tuple
+    old: tuple
+    new: tuple
+
+    def as_dict(self):
+        return {
+            field: {'old': old, 'new': new}
+            for field, old, new in zip(self.fields, self.old, self.new)
+        }
+
 
 @receiver(user_logged_in)
 def log_user_login(sender, request, user, **kwargs):
     """Log user login."""
-    AuditLog.objects.create(
+    audit.log(AuditLog(
         user=user,
         action='login',
         model_name='User',
         object_id=str(user.id),
         ip_address=request.META.get('REMOTE_ADDR'),
         user_agent=request.META.get('HTTP_USER_AGENT', ''),
-    )
+    ))
 
 
 @receiver(user_logged_out)
 def log_user_logout(sender, request, user, **kwargs):
     """Log user logout."""
     if user:
-        AuditLog.objects.create(
+        audit.log(AuditLog(
             user=user,
             action='logout',
             model_name='User',
             object_id=str(user.id),
             ip_address=request.META.get('REMOTE_ADDR'),
             user_agent=request.META.get('HTTP_USER_AGENT', ''),
-        )
+        ))
 
 
 @receiver(post_save, sender=User)
 def log_user_save(sender, instance, created, **kwargs):
     """Log user creation/update."""
     action = 'create' if created else 'update'
-    AuditLog.objects.create(
+    change_set = getattr(instance, '_change_set', None)
+    audit.log(AuditLog(
         user=instance,
         action=action,
         model_name='User',
         object_id=str(instance.id),
         details={
             'email': instance.email,
-            'changes': getattr(instance, '_change_details', {}),
+            'changes': change_set.as_dict() if change_set else {},
         }
-    )
+    ))
+    # Refresh the snapshot so a later save on this instance diffs against
+    # what was just written
+    snapshot = getattr(instance, '_loaded_values', None)
+    if snapshot is not None:
+        snapshot.update({field: getattr(instance, field) for field in TRACKED_FIELDS})
 
 
 @receiver(pre_save, sender=User)
 def track_user_changes(sender, instance, **kwargs):
-    """Track changes to user model."""
-    if instance.pk:
-        try:
-            old_instance = User.objects.get(pk=instance.pk)
-            changes = {}
-            for field in ['email', 'first_name', 'last_name', 'phone', 'department', 'position', 'is_active']:
-                old_value = getattr(old_instance, field)
-                new_value = getattr(instance, field)
-                if old_value != new_value:
-                    changes[field] = {'old': old_value, 'new': new_value}
-            instance._change_details = changes
-        except User.DoesNotExist:
-            instance._change_details = {}
+    """Track changes to user model.
+
+    Diffs against the values snapshotted when the instance was loaded
+    instead of refetching the row, so saving a user costs no extra SELECT.
+    """
+    loaded = getattr(instance, '_loaded_values', None)
+    update_fields = kwargs.get('update_fields')
+    fields, old_values, new_values = [], [], []
+
+    if instance.pk and loaded is not None:
+        for field, new_value in zip(TRACKED_FIELDS, _get_tracked(instance)):
+            if field not in loaded:
+                continue
+            if update_fields is not None and field not in update_fields:
+                continue
+            if loaded[field] != new_value:
+                fields.append(field)
+                old_values.append(loaded[field])
+                new_values.append(new_value)
+
+    instance._change_set = ChangeSet(tuple(fields), tuple(old_values), tuple(new_values)) if fields else None
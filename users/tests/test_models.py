@@ -7,25 +7,32 @@ from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from faker import Faker
 
+from products._fake import get_faker
+
 from users.models import AuditLog
 
-fake = Faker()
+Faker.seed(0)  # deterministic fixtures across runs
+fake = get_faker()
+
+# Generated once at import: the faker calls are paid per module, not per test
+FAKE_USER = {
+    'email': fake.email(),
+    'password': 'testpass123',
+    'first_name': fake.first_name(),
+    'last_name': fake.last_name(),
+    'phone': fake.phone_number()[:20],
+    'department': fake.job(),
+    'position': fake.job(),
+}
 
 
 class UserModelTests(TestCase):
     """Test User model."""
-    
-    def setUp(self):
-        self.User = get_user_model()
-        self.user_data = {
-            'email': fake.email(),
-            'password': 'testpass123',
-            'first_name': fake.first_name(),
-            'last_name': fake.last_name(),
-            'phone': fake.phone_number()[:20],
-            'department': fake.job(),
-            'position': fake.job(),
-        }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.User = get_user_model()
+        cls.user_data = dict(FAKE_USER)
     
     def test_create_user(self):
         """Test creating a regular user."""
@@ -87,9 +94,10 @@ class UserModelTests(TestCase):
 class AuditLogModelTests(TestCase):
     """Test AuditLog model."""
     
-    def setUp(self):
-        self.User = get_user_model()
-        self.user = self.User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.User = get_user_model()
+        cls.user = cls.User.objects.create_user(
             email='test@example.com',
             password='test123'
         )
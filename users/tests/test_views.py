@@ -2,26 +2,22 @@
 Tests for users views.
 """
 
-from django.test import TestCase, Client
+from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 
-from faker import Faker
-
-fake = Faker()
-
 
 class LoginViewTests(TestCase):
     """Test login view."""
     
-    def setUp(self):
-        self.client = Client()
-        self.User = get_user_model()
-        self.user = self.User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.User = get_user_model()
+        cls.user = cls.User.objects.create_user(
             email='test@example.com',
             password='testpass123'
         )
-        self.login_url = reverse('users:login')
+        cls.login_url = reverse('users:login')
     
     def test_login_get(self):
         """Test GET request to login page."""
@@ -59,14 +55,14 @@ class LoginViewTests(TestCase):
 class LogoutViewTests(TestCase):
     """Test logout view."""
     
-    def setUp(self):
-        self.client = Client()
-        self.User = get_user_model()
-        self.user = self.User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.User = get_user_model()
+        cls.user = cls.User.objects.create_user(
             email='test@example.com',
             password='testpass123'
         )
-        self.logout_url = reverse('users:logout')
+        cls.logout_url = reverse('users:logout')
     
     def test_logout(self):
         """Test logout functionality."""
@@ -79,16 +75,16 @@ class LogoutViewTests(TestCase):
 class ProfileViewTests(TestCase):
     """Test profile view."""
     
-    def setUp(self):
-        self.client = Client()
-        self.User = get_user_model()
-        self.user = self.User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.User = get_user_model()
+        cls.user = cls.User.objects.create_user(
             email='test@example.com',
             password='testpass123',
             first_name='John',
             last_name='Doe',
         )
-        self.profile_url = reverse('users:profile')
+        cls.profile_url = reverse('users:profile')
     
     def test_profile_view_requires_login(self):
         """Test profile view requires authentication."""